@@ -0,0 +1,62 @@
+"""Convert project audio_data to JSONB with GIN index
+
+Revision ID: 3c1e7a9b5d42
+Revises: 96f159ad243e
+Create Date: 2026-10-19 14:02:11.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1e7a9b5d42'
+down_revision: Union[str, None] = '96f159ad243e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # audio_data used to accept any text. Legacy values that are not a JSON object
+    # (invalid JSON, bare scalars, arrays) become NULL; double-encoded objects are unwrapped.
+    op.execute("""
+        CREATE FUNCTION project_audio_data_to_jsonb(value text) RETURNS jsonb AS $$
+        DECLARE
+            parsed jsonb;
+        BEGIN
+            parsed := value::jsonb;
+            IF jsonb_typeof(parsed) = 'string' THEN
+                parsed := (parsed #>> '{}')::jsonb;
+            END IF;
+            IF jsonb_typeof(parsed) <> 'object' THEN
+                RETURN NULL;
+            END IF;
+            RETURN parsed;
+        EXCEPTION WHEN others THEN
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE
+    """)
+    op.alter_column('projects', 'audio_data',
+               existing_type=sa.Text(),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=True,
+               postgresql_using='project_audio_data_to_jsonb(audio_data)')
+    op.execute('DROP FUNCTION project_audio_data_to_jsonb(text)')
+    op.create_index('ix_projects_audio_data', 'projects', ['audio_data'],
+               unique=False,
+               postgresql_using='gin',
+               postgresql_ops={'audio_data': 'jsonb_path_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_audio_data', table_name='projects',
+               postgresql_using='gin')
+    op.alter_column('projects', 'audio_data',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=sa.Text(),
+               existing_nullable=True,
+               postgresql_using='audio_data::text')
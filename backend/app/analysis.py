@@ -0,0 +1,301 @@
+import hashlib
+import io
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from threading import Lock
+from typing import List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Sample library shipped with the frontend; override in Docker/production
+SAMPLE_LIBRARY_DIR = Path(os.getenv(
+    "SAMPLE_LIBRARY_DIR",
+    Path(__file__).resolve().parents[2] / "frontend" / "public" / "samples"
+))
+SAMPLE_EXTENSIONS = {".mp3", ".wav", ".flac", ".ogg"}
+
+# Each worker can hold a decoded track (~10 MB per stereo minute), so keep the pool small
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", 2))
+ANALYSIS_CACHE_SIZE = 256
+
+# STFT settings
+N_FFT = 2048
+HOP_LENGTH = 512
+FRAME_BLOCK = 1024  # Frames per FFT block - bounds memory on full-length tracks
+LOG_COMPRESSION = 100.0
+
+# Longest file accepted for analysis - checked from the header before decoding
+MAX_DURATION_SECONDS = 10 * 60
+
+# Onset peak picking (in frames, ~11.6ms each at 44.1kHz)
+PEAK_WINDOW = 3
+MEAN_WINDOW = 16
+PEAK_DELTA = 0.07
+
+# Tempo range matches the sequencer BPM range
+MIN_BPM = 60.0
+MAX_BPM = 240.0
+PRIOR_BPM = 120.0
+
+# Clip suggestions - mirror the sampler (16 pads) and waveform clip defaults
+PAD_COUNT = 16
+BEATS_PER_SLICE = 4
+DEFAULT_SLICE_SECONDS = 2.0
+MIN_CLIP_SECONDS = 0.1
+CLIP_COLOR = "rgba(128, 128, 128, 0.25)"
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = Lock()
+_cache: "OrderedDict[str, dict]" = OrderedDict()
+_cache_lock = Lock()
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def decode_audio(data: bytes) -> Tuple[np.ndarray, int]:
+    """Decode audio bytes to a mono float32 signal.
+
+    Files longer than MAX_DURATION_SECONDS are rejected from the header alone,
+    so a small compressed upload cannot expand into gigabytes of samples.
+    """
+    try:
+        info = sf.info(io.BytesIO(data))
+        if info.frames / info.samplerate > MAX_DURATION_SECONDS:
+            raise ValueError(f"Audio longer than {MAX_DURATION_SECONDS // 60} minutes is not supported")
+        samples, sample_rate = sf.read(io.BytesIO(data), dtype="float32", always_2d=True)
+    except (sf.LibsndfileError, RuntimeError, TypeError):
+        # Re-raised as ValueError so it pickles cleanly out of the process pool
+        raise ValueError("Unsupported or corrupt audio file")
+    return samples.mean(axis=1), sample_rate
+
+
+def onset_envelope(signal: np.ndarray) -> np.ndarray:
+    """Spectral flux of the log-magnitude STFT, one value per hop."""
+    padded = np.pad(signal, N_FFT // 2)
+    frames = sliding_window_view(padded, N_FFT)[::HOP_LENGTH]
+    window = np.hanning(N_FFT).astype(np.float32)
+
+    flux = np.empty(len(frames), dtype=np.float32)
+    previous = None
+    for start in range(0, len(frames), FRAME_BLOCK):
+        block = frames[start:start + FRAME_BLOCK]
+        magnitude = np.log1p(LOG_COMPRESSION * np.abs(np.fft.rfft(block * window, axis=1)))
+
+        # Treat the signal as starting from silence so an attack at t=0 registers,
+        # then carry the last frame across blocks so each block's first diff is correct
+        if previous is None:
+            previous = np.zeros_like(magnitude[:1])
+        shifted = np.concatenate((previous, magnitude[:-1]))
+        flux[start:start + len(block)] = np.maximum(magnitude - shifted, 0.0).sum(axis=1)
+        previous = magnitude[-1:]
+
+    peak = flux.max()
+    return flux / peak if peak > 0 else flux
+
+
+def pick_onsets(envelope: np.ndarray) -> np.ndarray:
+    """Frame indices that are local maxima above an adaptive moving-mean threshold."""
+    local_max = sliding_window_view(
+        np.pad(envelope, PEAK_WINDOW, constant_values=-np.inf), 2 * PEAK_WINDOW + 1
+    ).max(axis=1)
+
+    cumulative = np.concatenate(([0.0], np.cumsum(envelope, dtype=np.float64)))
+    index = np.arange(len(envelope))
+    lo = np.maximum(index - MEAN_WINDOW, 0)
+    hi = np.minimum(index + MEAN_WINDOW + 1, len(envelope))
+    local_mean = (cumulative[hi] - cumulative[lo]) / (hi - lo)
+
+    peaks = np.flatnonzero((envelope == local_max) & (envelope >= local_mean + PEAK_DELTA))
+    # Flat-topped peaks match on several adjacent frames; keep the first of each run
+    if len(peaks):
+        peaks = peaks[np.concatenate(([True], np.diff(peaks) > PEAK_WINDOW))]
+    return peaks
+
+
+def estimate_tempo(envelope: np.ndarray, sample_rate: int) -> Optional[float]:
+    """Tempo from the onset envelope autocorrelation, weighted towards PRIOR_BPM."""
+    frames_per_minute = 60.0 * sample_rate / HOP_LENGTH
+    # Round inwards so every candidate lag maps to a tempo inside [MIN_BPM, MAX_BPM]
+    min_lag = max(int(np.ceil(frames_per_minute / MAX_BPM)), 1)
+    max_lag = int(np.floor(frames_per_minute / MIN_BPM))
+    if len(envelope) <= 2 * max_lag:
+        return None
+
+    centered = envelope - envelope.mean()
+    spectrum = np.fft.rfft(centered, n=2 * len(centered))
+    autocorrelation = np.fft.irfft(spectrum * np.conj(spectrum))[:max_lag + 1]
+
+    lags = np.arange(min_lag, max_lag + 1)
+    bpms = frames_per_minute / lags
+    # Log-normal prior suppresses half/double tempo picks
+    prior = np.exp(-0.5 * np.log2(bpms / PRIOR_BPM) ** 2)
+    scores = autocorrelation[lags] * prior
+    if scores.max() <= 0:
+        return None
+    return float(bpms[np.argmax(scores)])
+
+
+def suggest_clips(
+    onset_times: np.ndarray,
+    strengths: np.ndarray,
+    duration: float,
+    tempo: Optional[float],
+    clip_prefix: str
+) -> List[dict]:
+    """Pick up to PAD_COUNT well-spaced, strongest onsets and turn them into pad clips."""
+    slice_length = BEATS_PER_SLICE * 60.0 / tempo if tempo else DEFAULT_SLICE_SECONDS
+    # Tighten spacing on short files so all pads can still be filled
+    spacing = min(slice_length, duration / (2 * PAD_COUNT))
+
+    starts: List[float] = []
+    for i in np.argsort(-strengths, kind="stable"):
+        start = float(onset_times[i])
+        if duration - start < MIN_CLIP_SECONDS:
+            continue
+        if all(abs(start - other) >= spacing for other in starts):
+            starts.append(start)
+            if len(starts) == PAD_COUNT:
+                break
+    starts.sort()
+
+    clips = []
+    for pad, start in enumerate(starts):
+        next_start = starts[pad + 1] if pad + 1 < len(starts) else duration
+        end = min(start + slice_length, next_start, duration)
+        clips.append({
+            "id": f"{clip_prefix}-{pad}",
+            "startTime": start,
+            "endTime": end,
+            "visualStartTime": start,
+            "visualEndTime": end,
+            "color": CLIP_COLOR,
+            "name": f"Clip {pad + 1}",
+            "padAssignment": pad,
+        })
+    return clips
+
+
+def analyze_audio(data: bytes, digest: str) -> dict:
+    """Full analysis of one file. Runs inside the process pool."""
+    signal, sample_rate = decode_audio(data)
+    duration = len(signal) / sample_rate
+
+    envelope = onset_envelope(signal)
+    onset_frames = pick_onsets(envelope)
+    onset_times = onset_frames * HOP_LENGTH / sample_rate
+    tempo = estimate_tempo(envelope, sample_rate)
+
+    return {
+        "file_hash": digest,
+        "duration": duration,
+        "sample_rate": sample_rate,
+        "tempo": tempo,
+        "onsets": onset_times.tolist(),
+        "clips": suggest_clips(
+            onset_times, envelope[onset_frames], duration, tempo, f"slice-{digest[:8]}"
+        ),
+    }
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # forkserver, not fork: the pool is created from a request thread, and forked
+            # workers would inherit held locks and the database engine's sockets
+            _executor = ProcessPoolExecutor(
+                max_workers=ANALYSIS_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+        return _executor
+
+
+def _discard_executor(broken: ProcessPoolExecutor):
+    """Drop a broken pool so the next request starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        # Another request may already have replaced it
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+            _executor = None
+
+
+def analyze_batch(items: List[Tuple[str, bytes]]) -> List[dict]:
+    """Analyze (source, data) pairs, reusing cached results keyed by file hash.
+
+    Cache misses are fanned out across the process pool. Raises ValueError
+    naming the source if a file cannot be decoded, and BrokenProcessPool if a
+    worker died (e.g. OOM-killed); the pool is reset before re-raising.
+    """
+    digests = [file_hash(data) for _, data in items]
+
+    found = {}
+    pending = {}
+    with _cache_lock:
+        for (source, data), digest in zip(items, digests):
+            if digest in found or digest in pending:
+                continue
+            cached = _cache.get(digest)
+            if cached is not None:
+                _cache.move_to_end(digest)
+                found[digest] = cached
+            else:
+                pending[digest] = (source, data)
+
+    if pending:
+        executor = get_executor()
+        futures = {}
+        try:
+            for digest, (_, data) in pending.items():
+                futures[digest] = executor.submit(analyze_audio, data, digest)
+            for digest, future in futures.items():
+                try:
+                    found[digest] = future.result()
+                except ValueError as e:
+                    raise ValueError(f"{pending[digest][0]}: {e}") from e
+                with _cache_lock:
+                    _cache[digest] = found[digest]
+                    while len(_cache) > ANALYSIS_CACHE_SIZE:
+                        _cache.popitem(last=False)
+        except BrokenProcessPool:
+            _discard_executor(executor)
+            raise
+        finally:
+            # Free workers from the rest of a failed batch; no-op for finished futures
+            for future in futures.values():
+                future.cancel()
+
+    return [{"source": source, **found[digest]} for (source, _), digest in zip(items, digests)]
+
+
+def library_samples() -> List[str]:
+    if not SAMPLE_LIBRARY_DIR.is_dir():
+        return []
+    return sorted(
+        path.name for path in SAMPLE_LIBRARY_DIR.iterdir()
+        if path.is_file() and path.suffix.lower() in SAMPLE_EXTENSIONS
+    )
+
+
+def read_library_sample(name: str) -> bytes:
+    """Read a sample from the library. Raises KeyError for unknown names."""
+    # Only names from the directory listing are accepted, which rules out path traversal
+    if name not in library_samples():
+        raise KeyError(name)
+    return (SAMPLE_LIBRARY_DIR / name).read_bytes()
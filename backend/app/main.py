@@ -1,13 +1,23 @@
+from contextlib import asynccontextmanager
 from app import models
+from app.analysis import shutdown_executor
 from app.database import engine
-from app.routers import auth, projects
+from app.routers import analysis, auth, projects
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Create database tables
 models.Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Sixty Labs API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop analysis worker processes on shutdown
+    shutdown_executor()
+
+
+app = FastAPI(title="Sixty Labs API", version="1.0.0", lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -28,6 +38,7 @@ app.add_middleware(
 # Include routers
 app.include_router(auth.router)
 app.include_router(projects.router)
+app.include_router(analysis.router)
 
 
 @app.get("/")
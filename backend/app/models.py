@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -20,6 +21,16 @@ class Project(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)
     name = Column(String, nullable=False)
-    audio_data = Column(Text)  # Store audio processing data as JSON
+    audio_data = Column(JSONB)  # Project state (effects + clips), see schemas.ProjectState
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        # jsonb_path_ops GIN index serves the @> containment filters in /api/projects/search
+        Index(
+            "ix_projects_audio_data",
+            audio_data,
+            postgresql_using="gin",
+            postgresql_ops={"audio_data": "jsonb_path_ops"},
+        ),
+    )
\ No newline at end of file
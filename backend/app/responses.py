@@ -0,0 +1,32 @@
+import os
+from typing import Any, List
+from fastapi import Response, status
+from pydantic import TypeAdapter
+from app import schemas
+
+# Opt-in fast JSON responses - skips FastAPI's intermediate Python-object serialization and the stdlib json encoder
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+
+# Adapters are built once at import time; building them per request is expensive
+project_adapter = TypeAdapter(schemas.Project)
+project_list_adapter = TypeAdapter(List[schemas.Project])
+project_summary_list_adapter = TypeAdapter(List[schemas.ProjectSummary])
+user_profile_adapter = TypeAdapter(schemas.UserProfile)
+
+
+def serialize(adapter: TypeAdapter, obj: Any) -> bytes:
+    """Validate ORM rows once and dump them straight to JSON bytes in pydantic-core."""
+    return adapter.dump_json(adapter.validate_python(obj, from_attributes=True))
+
+
+def json_response(
+    adapter: TypeAdapter,
+    obj: Any,
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Build a ready-to-send JSON response, bypassing response_model processing."""
+    return Response(
+        content=serialize(adapter, obj),
+        status_code=status_code,
+        media_type="application/json"
+    )
@@ -0,0 +1,77 @@
+from concurrent.futures.process import BrokenProcessPool
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from typing import List
+from app import models, schemas, auth, analysis
+
+router = APIRouter(prefix="/api/analysis", tags=["Analysis"])
+
+MAX_BATCH_FILES = 32
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024  # Per uploaded file
+MAX_BATCH_BYTES = 200 * 1024 * 1024  # Across all uploads in one request
+
+@router.get("/samples", response_model=List[str])
+def get_library_samples(
+    current_user: models.User = Depends(auth.get_current_active_user)
+):
+    """List sample library files available for analysis."""
+    return analysis.library_samples()
+
+@router.post("/slices", response_model=List[schemas.SliceAnalysis])
+def suggest_slices(
+    samples: List[str] = Form(default=[]),
+    files: List[UploadFile] = File(default=[]),
+    current_user: models.User = Depends(auth.get_current_active_user)
+):
+    """Detect onsets and tempo for library samples and uploads, and suggest 16 pad clips each."""
+    if not samples and not files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No samples or files provided"
+        )
+
+    if len(samples) + len(files) > MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_FILES} files can be analyzed per request"
+        )
+
+    items = []
+    for name in samples:
+        try:
+            items.append((name, analysis.read_library_sample(name)))
+        except KeyError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Sample not found: {name}"
+            )
+
+    upload_bytes = 0
+    for upload in files:
+        filename = upload.filename or "upload"
+        # Read one byte past the limit so oversized files are caught without reading them whole
+        data = upload.file.read(MAX_UPLOAD_BYTES + 1)
+        if len(data) > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"{filename} exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit"
+            )
+        upload_bytes += len(data)
+        if upload_bytes > MAX_BATCH_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Uploads exceed the {MAX_BATCH_BYTES // (1024 * 1024)} MB per-request limit"
+            )
+        items.append((filename, data))
+
+    try:
+        return analysis.analyze_batch(items)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except BrokenProcessPool:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Analysis worker crashed, possibly on a file that is too large to decode. Please retry"
+        )
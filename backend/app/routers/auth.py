@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from sqlalchemy.orm import Session
-from app import models, schemas, auth
+from app import models, schemas, auth, responses
 from app.database import get_db
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
@@ -131,6 +131,8 @@ async def get_current_user_profile(
     current_user: models.User = Depends(auth.get_current_active_user)
 ):
     """Get current authenticated user's profile."""
+    if responses.FAST_JSON_RESPONSES:
+        return responses.json_response(responses.user_profile_adapter, current_user)
     return current_user
 
 
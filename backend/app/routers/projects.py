@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import Field
+from sqlalchemy import cast, func
+from sqlalchemy.dialects.postgresql import JSONPATH
 from sqlalchemy.orm import Session
-from typing import List
-from app import models, schemas, auth
+from typing import Annotated, List, Optional
+from app import models, schemas, auth, responses
 from app.database import get_db
 
 router = APIRouter(prefix="/api/projects", tags=["Projects"])
 
+# Matches projects with at least one clip whose name starts with $prefix
+CLIP_NAME_PREFIX_PATH = "$.clips[*] ? (@.name starts with $prefix)"
+
 @router.post("/", response_model=schemas.Project, status_code=status.HTTP_201_CREATED)
 def create_project(
     project: schemas.ProjectCreate,
@@ -19,6 +25,13 @@ def create_project(
     db.add(db_project)
     db.commit()
     db.refresh(db_project)
+
+    if responses.FAST_JSON_RESPONSES:
+        return responses.json_response(
+            responses.project_adapter,
+            db_project,
+            status_code=status.HTTP_201_CREATED
+        )
     return db_project
 
 @router.get("/", response_model=List[schemas.Project])
@@ -29,6 +42,53 @@ def get_user_projects(
     projects = db.query(models.Project).filter(
         models.Project.user_id == current_user.id
     ).all()
+
+    if responses.FAST_JSON_RESPONSES:
+        return responses.json_response(responses.project_list_adapter, projects)
+    return projects
+
+@router.get("/search", response_model=List[schemas.ProjectSummary])
+def search_projects(
+    effects: List[schemas.EffectName] = Query(default=[]),
+    pads: List[Annotated[int, Field(ge=0, le=15)]] = Query(default=[]),
+    name_prefix: Optional[str] = None,
+    clip_name_prefix: Optional[str] = None,
+    current_user: models.User = Depends(auth.get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Filter the user's projects by enabled effects, pad assignments and names, in Postgres."""
+    query = db.query(
+        models.Project.id,
+        models.Project.name,
+        models.Project.created_at,
+        models.Project.updated_at
+    ).filter(
+        models.Project.user_id == current_user.id
+    )
+
+    # Effect and pad filters are folded into one @> containment so the GIN index is used
+    criteria = {}
+    if effects:
+        criteria["effects"] = {f"{effect}Enabled": True for effect in effects}
+    if pads:
+        criteria["clips"] = [{"padAssignment": pad} for pad in pads]
+    if criteria:
+        query = query.filter(models.Project.audio_data.contains(criteria))
+
+    if name_prefix:
+        query = query.filter(models.Project.name.startswith(name_prefix, autoescape=True))
+
+    if clip_name_prefix:
+        query = query.filter(func.jsonb_path_exists(
+            models.Project.audio_data,
+            cast(CLIP_NAME_PREFIX_PATH, JSONPATH),
+            func.jsonb_build_object("prefix", clip_name_prefix)
+        ))
+
+    projects = query.order_by(models.Project.id).all()
+
+    if responses.FAST_JSON_RESPONSES:
+        return responses.json_response(responses.project_summary_list_adapter, projects)
     return projects
 
 @router.get("/{project_id}", response_model=schemas.Project)
@@ -48,4 +108,6 @@ def get_project(
             detail="Project not found"
         )
     
+    if responses.FAST_JSON_RESPONSES:
+        return responses.json_response(responses.project_adapter, project)
     return project
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional
 
 # User Schemas
 class UserBase(BaseModel):
@@ -49,15 +49,116 @@ class AuthStatusResponse(BaseModel):
     authenticated: bool
     user: Optional[UserProfile] = None
 
+# Project State Schemas - mirror the frontend types in types/audio.ts
+EffectName = Literal[
+    "pitch", "delay", "reverb", "convolver", "tremolo", "bitcrush",
+    "granular", "radio", "drunk", "eq", "repeat",
+]
+
+class Clip(BaseModel):
+    id: str
+    startTime: float
+    endTime: float
+    visualStartTime: float
+    visualEndTime: float
+    color: Optional[str] = None
+    name: Optional[str] = None
+    padAssignment: Optional[int] = Field(default=None, ge=0, le=15)
+
+    class Config:
+        extra = "allow"
+
+class EffectsState(BaseModel):
+    # Volume & Pitch
+    volume: float
+    pitch: float
+    reverse: bool
+
+    # Delay
+    delayTime: float
+    delayFeedback: float
+    delayMix: float
+
+    # Reverb
+    reverbRoomSize: float
+    reverbDecay: float
+    reverbMix: float
+
+    # Convolver
+    convolverMix: float
+
+    # Tremolo
+    tremoloRate: float
+    tremoloDepth: float
+    tremoloMix: float
+
+    # EQ
+    eqLowGain: float
+    eqMidGain: float
+    eqHighGain: float
+    eqMix: float
+
+    # Bitcrush
+    bitcrushBitDepth: float
+    bitcrushSampleRate: float
+    bitcrushMix: float
+
+    # Granular
+    granularGrainSize: float
+    granularOverlap: float
+    granularChaos: float
+    granularMix: float
+    granularPitch: float
+
+    # Radio
+    radioDistortion: float
+    radioStatic: float
+    radioMix: float
+
+    # Drunk
+    drunkWobble: float
+    drunkSpeed: float
+    drunkMix: float
+
+    # Repeat
+    repeat: float
+    repeatCycleSize: float
+
+    # Effect enable flags
+    pitchEnabled: bool
+    delayEnabled: bool
+    reverbEnabled: bool
+    convolverEnabled: bool
+    tremoloEnabled: bool
+    bitcrushEnabled: bool
+    granularEnabled: bool
+    radioEnabled: bool
+    drunkEnabled: bool
+    eqEnabled: bool
+    repeatEnabled: bool
+
+    class Config:
+        extra = "allow"
+
+class ProjectState(BaseModel):
+    effects: Optional[EffectsState] = None
+    clips: List[Clip] = []
+
+    # Keep keys the schema doesn't model yet (e.g. SamplerState pads/sequencer/mode)
+    # rather than silently dropping them before the row is written
+    class Config:
+        extra = "allow"
+
 # Project Schemas
 class ProjectBase(BaseModel):
     name: str
-    audio_data: Optional[str] = None
 
 class ProjectCreate(ProjectBase):
-    pass
+    audio_data: Optional[ProjectState] = None
 
 class Project(ProjectBase):
+    # Returned as stored - rows saved before ProjectState existed may not match it
+    audio_data: Optional[Dict[str, Any]] = None
     id: int
     user_id: int
     created_at: datetime
@@ -65,3 +166,22 @@ class Project(ProjectBase):
 
     class Config:
         from_attributes = True
+
+class ProjectSummary(BaseModel):
+    id: int
+    name: str
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+# Analysis Schemas
+class SliceAnalysis(BaseModel):
+    source: str
+    file_hash: str
+    duration: float
+    sample_rate: int
+    tempo: Optional[float] = None
+    onsets: List[float]
+    clips: List[Clip]
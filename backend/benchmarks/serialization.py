@@ -0,0 +1,105 @@
+"""Benchmark project list serialization: FastAPI response_model path vs the fast path.
+
+Run from the backend directory:
+    python -m benchmarks.serialization
+"""
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app import schemas, responses
+
+PAYLOAD_SIZES_MB = [0.1, 1, 10]
+PROJECTS_PER_LIST = 20
+ROUNDS = 5
+
+
+# Approximate serialized size of one clip in audio_data
+CLIP_BYTES = 150
+
+
+def make_clip(i: int) -> dict:
+    return {
+        "id": f"clip-{i}",
+        "startTime": i * 0.25,
+        "endTime": i * 0.25 + 0.25,
+        "visualStartTime": i * 0.25,
+        "visualEndTime": i * 0.25 + 0.25,
+        "color": "#ff6b6b",
+        "name": f"Clip {i}",
+        "padAssignment": i % 16,
+    }
+
+
+def make_rows(total_mb: float) -> List[SimpleNamespace]:
+    """Build ORM-like project rows whose audio_data adds up to roughly total_mb."""
+    clips_per_project = int(total_mb * 1024 * 1024 / PROJECTS_PER_LIST / CLIP_BYTES)
+    clips = [make_clip(i) for i in range(clips_per_project)]
+    now = datetime.now(timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            user_id=1,
+            name=f"Project {i}",
+            audio_data={"effects": None, "clips": clips},
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(PROJECTS_PER_LIST)
+    ]
+
+
+# Built the same way APIRoute builds the response field for response_model=List[schemas.Project]
+response_field = create_response_field(
+    name="Response_get_user_projects",
+    type_=List[schemas.Project],
+    mode="serialization"
+)
+
+
+def standard_path(rows: List[SimpleNamespace]) -> bytes:
+    """FastAPI's own response_model pipeline: serialize_response, then JSONResponse.render."""
+    content = asyncio.run(serialize_response(field=response_field, response_content=rows))
+    return JSONResponse(content).body
+
+
+def fast_path(rows: List[SimpleNamespace]) -> bytes:
+    return responses.serialize(responses.project_list_adapter, rows)
+
+
+def timed(fn, rows) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'payload':>10} {'standard ms/MB':>16} {'fast ms/MB':>12} {'speedup':>8}")
+    for size_mb in PAYLOAD_SIZES_MB:
+        rows = make_rows(size_mb)
+        body = fast_path(rows)
+        assert json.loads(standard_path(rows)) == json.loads(body)
+
+        # Normalize by the real size of the response body rather than the requested size
+        actual_mb = len(body) / (1024 * 1024)
+        standard = timed(standard_path, rows) * 1000 / actual_mb
+        fast = timed(fast_path, rows) * 1000 / actual_mb
+        print(f"{actual_mb:>7.2f} MB {standard:>16.2f} {fast:>12.2f} {standard / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()